@@ -29,18 +29,19 @@ Implementation Notes
 
 """
 
+import sys
 import time
 
-try:
-    # This is only needed for typing
-    import busio  # pylint: disable=unused-import
-except ImportError:
-    pass
-
-
 from adafruit_bus_device.i2c_device import I2CDevice
 from micropython import const
 
+if sys.implementation.name == "cpython":
+    # This is only needed for typing. MicroPython and CircuitPython don't evaluate
+    # annotations, so skip the import there rather than attempt it on every boot.
+    import array
+    import busio  # pylint: disable=unused-import
+
+
 __version__: str = "0.0.0+auto.0"
 __repo__: str = "https://github.com/adafruit/Adafruit_CircuitPython_AHTx0.git"
 
@@ -52,6 +53,58 @@ AHTX0_CMD_SOFTRESET: int = const(0xBA)  # Soft reset command
 AHTX0_STATUS_BUSY: int = const(0x80)  # Status bit for busy
 AHTX0_STATUS_CALIBRATED: int = const(0x08)  # Status bit for calibrated
 
+_AHT_CALIBRATE_ARG: int = const(0x08)  # First parameter byte of the calibrate command
+_AHT_TRIGGER_ARG: int = const(0x33)  # First parameter byte of the trigger command
+_AHT_CMD_PAD: int = const(0x00)  # Trailing parameter byte of calibrate/trigger
+_AHT_RAW_FULL_SCALE: int = const(0x100000)  # 2**20, full scale of a 20-bit reading
+
+# Complete command sequences, built once so the hot paths can write them directly
+_CMD_RESET = bytes((AHTX0_CMD_SOFTRESET,))
+_CMD_CALIBRATE_AHT10 = bytes((AHT10_CMD_CALIBRATE, _AHT_CALIBRATE_ARG, _AHT_CMD_PAD))
+_CMD_CALIBRATE_AHT20 = bytes((AHT20_CMD_CALIBRATE, _AHT_CALIBRATE_ARG, _AHT_CMD_PAD))
+_CMD_TRIGGER = bytes((AHTX0_CMD_TRIGGER, _AHT_TRIGGER_ARG, _AHT_CMD_PAD))
+
+# const() only takes integers, so the float values below stay plain module globals.
+# Raw 20-bit readings to percent / degrees Celsius, as multipliers to avoid division
+_HUM_SCALE = 100.0 / _AHT_RAW_FULL_SCALE
+_TEMP_SCALE = 200.0 / _AHT_RAW_FULL_SCALE
+
+_AHT_MEAS_TIME = 0.08  # Typical conversion time from the datasheet, in seconds
+_AHT_POLL_INTERVAL = 0.002  # Busy-bit polling interval, in seconds
+_AHT_STARTUP_TIME = 0.02  # Wake-up delay after power-on or soft reset, in seconds
+_AHT_CALIBRATE_RETRY_DELAY = 0.01  # Pause before the AHT20 calibrate command
+_AHT_BUSY_TIMEOUT = 3.0  # Longest calibration wait before giving up, in seconds
+
+
+def _unpack(buf: bytearray) -> tuple:
+    """Split a measurement reading into its raw 20-bit humidity and temperature"""
+    humidity = (buf[1] << 12) | (buf[2] << 4) | (buf[3] >> 4)
+    temp = ((buf[3] & 0xF) << 16) | (buf[4] << 8) | buf[5]
+    return humidity, temp
+
+
+def _scale(raw_temp: int, raw_humidity: int) -> tuple:
+    """Convert raw 20-bit readings to degrees Celsius and percent relative humidity"""
+    return raw_temp * _TEMP_SCALE - 50.0, raw_humidity * _HUM_SCALE
+
+
+if sys.implementation.name == "cpython":
+    # Rebuild _scale with the scale factors baked in as literals, so each call on a
+    # host computer skips two global lookups. Other ports keep the version above.
+    _namespace = {}
+    exec(  # pylint: disable=exec-used
+        compile(
+            "def _scale(raw_temp, raw_humidity):\n"
+            "    return raw_temp * %r - 50.0, raw_humidity * %r\n"
+            % (_TEMP_SCALE, _HUM_SCALE),
+            "<adafruit_ahtx0>",
+            "exec",
+        ),
+        _namespace,
+    )
+    _scale = _namespace["_scale"]
+    del _namespace
+
 
 class AHTx0:
     """
@@ -90,92 +143,195 @@ class AHTx0:
     def __init__(
         self, i2c_bus: busio.I2C, address: int = AHTX0_I2CADDR_DEFAULT
     ) -> None:
-        time.sleep(0.02)  # 20ms delay to wake up
+        time.sleep(_AHT_STARTUP_TIME)  # 20ms delay to wake up
         self.i2c_device = I2CDevice(i2c_bus, address)
-        self._buf = bytearray(6)
-        self.reset()
-        if not self.calibrate():
-            raise RuntimeError("Could not calibrate")
-        self._temp = None
-        self._humidity = None
+        self._buf = bytearray(6)  # measurement reads only
+        self._stat = bytearray(1)  # status polls, so they never touch self._buf
+        self._measurement = None
+        self._last_read = 0.0
+        self._cache_s = 0.1
+        self._ready_at = 0.0
+        self._pending = False  # set by trigger(), cleared by fetch()
+        # A sensor that stayed powered (e.g. a warm reboot) is already calibrated
+        # and idle, so the reset and calibration can be skipped
+        status = self._read_status()
+        if (
+            status & (AHTX0_STATUS_BUSY | AHTX0_STATUS_CALIBRATED)
+        ) != AHTX0_STATUS_CALIBRATED:
+            self.reset()
+            if not self.calibrate():
+                raise RuntimeError("Could not calibrate")
 
     def reset(self) -> None:
         """Perform a soft-reset of the AHT"""
-        self._buf[0] = AHTX0_CMD_SOFTRESET
         with self.i2c_device as i2c:
-            i2c.write(self._buf, start=0, end=1)
-        time.sleep(0.02)  # 20ms delay to wake up
+            i2c.write(_CMD_RESET)
+        time.sleep(_AHT_STARTUP_TIME)  # 20ms delay to wake up
 
     def calibrate(self) -> bool:
         """Ask the sensor to self-calibrate. Returns True on success, False otherwise"""
-        self._buf[0] = AHT10_CMD_CALIBRATE
-        self._buf[1] = 0x08
-        self._buf[2] = 0x00
         calibration_failed = False
         with self.i2c_device as i2c:
             try:
                 # Newer AHT20's may not succeed with old command, so wrapping in try/except
-                i2c.write(self._buf, start=0, end=3)
+                i2c.write(_CMD_CALIBRATE_AHT10)
             except (RuntimeError, OSError):
                 calibration_failed = True
 
         if calibration_failed:
             # try another calibration command for newer AHT20's
             # print("Calibration failed, trying AH20 command")
-            time.sleep(0.01)
-            self._buf[0] = AHT20_CMD_CALIBRATE
+            time.sleep(_AHT_CALIBRATE_RETRY_DELAY)
             with self.i2c_device as i2c:
                 try:
-                    i2c.write(self._buf, start=0, end=3)
+                    i2c.write(_CMD_CALIBRATE_AHT20)
                 except (RuntimeError, OSError):
                     pass
 
         start_busy_time = time.monotonic()
-        while self.status & AHTX0_STATUS_BUSY:
-            if time.monotonic() - start_busy_time > 3.0:
+        time.sleep(_AHT_MEAS_TIME)
+        # Read the status once per poll and test both bits on the same value
+        status = self._read_status()
+        while status & AHTX0_STATUS_BUSY:
+            if time.monotonic() - start_busy_time > _AHT_BUSY_TIMEOUT:
                 raise RuntimeError(
                     "Sensor remained busy 3 seconds. Could not be calibrated"
                 )
-            time.sleep(0.01)
-        if not self.status & AHTX0_STATUS_CALIBRATED:
-            return False
-        return True
+            time.sleep(_AHT_POLL_INTERVAL)
+            status = self._read_status()
+        # Calibrated and idle, checked with one masked compare
+        return (
+            status & (AHTX0_STATUS_BUSY | AHTX0_STATUS_CALIBRATED)
+        ) == AHTX0_STATUS_CALIBRATED
 
     @property
     def status(self) -> int:
         """The status byte initially returned from the sensor, see datasheet for details"""
+        return self._read_status()
+
+    def _read_status(self) -> int:
+        """Internal function for reading the status byte in a single transaction"""
         with self.i2c_device as i2c:
-            i2c.readinto(self._buf, start=0, end=1)
-        # print("status: "+hex(self._buf[0]))
-        return self._buf[0]
+            i2c.readinto(self._stat)
+        # print("status: "+hex(self._stat[0]))
+        return self._stat[0]
 
     @property
-    def relative_humidity(self) -> int:
+    def cache_seconds(self) -> float:
+        """How long, in seconds, a measurement is reused before :attr:`temperature`
+        or :attr:`relative_humidity` trigger a new one. Reading both back-to-back
+        then costs a single conversion. Set to ``0`` to always take a fresh reading.
+        Defaults to ``0.1``."""
+        return self._cache_s
+
+    @cache_seconds.setter
+    def cache_seconds(self, value: float) -> None:
+        self._cache_s = value
+
+    @property
+    def measurements(self) -> tuple:
+        """The measured temperature in degrees Celsius and relative humidity in
+        percent, as a ``(temperature, relative_humidity)`` tuple from one reading."""
+        return self._readdata()
+
+    @property
+    def relative_humidity(self) -> float:
         """The measured relative humidity in percent."""
-        self._readdata()
-        return self._humidity
+        return self._readdata()[1]
 
     @property
-    def temperature(self) -> int:
+    def temperature(self) -> float:
         """The measured temperature in degrees Celsius."""
-        self._readdata()
-        return self._temp
+        return self._readdata()[0]
 
-    def _readdata(self) -> None:
+    def trigger(self) -> None:
+        """Start a measurement and return immediately. Check :attr:`data_ready`
+        and then call :meth:`fetch` to collect the result, doing other work
+        while the sensor converts."""
+        with self.i2c_device as i2c:
+            i2c.write(_CMD_TRIGGER)
+        self._ready_at = time.monotonic() + _AHT_MEAS_TIME
+        self._pending = True
+
+    @property
+    def data_ready(self) -> bool:
+        """True once the measurement started by :meth:`trigger` has finished"""
+        if not self._pending or time.monotonic() < self._ready_at:
+            return False
+        return not self._read_status() & AHTX0_STATUS_BUSY
+
+    def fetch(self) -> tuple:
+        """Read out the measurement started by :meth:`trigger`. Only call this
+        once :attr:`data_ready` is True. Returns a ``(temperature, relative_humidity)``
+        tuple, or raises :class:`RuntimeError` if no measurement was triggered."""
+        if not self._pending:
+            raise RuntimeError("No measurement pending, call trigger() first")
+        with self.i2c_device as i2c:
+            i2c.readinto(self._buf)
+        self._pending = False
+        return self._convert()
+
+    async def measure(self) -> tuple:
+        """Take a measurement without blocking the event loop. Sleeps with
+        ``asyncio.sleep`` while the sensor converts, so other tasks can run.
+        Returns a ``(temperature, relative_humidity)`` tuple."""
+        # Imported here so synchronous users never load asyncio
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        # The bus is released between steps so other tasks can use it while we wait
+        self.trigger()
+        await asyncio.sleep(_AHT_MEAS_TIME)
+        while not self.data_ready:
+            await asyncio.sleep(_AHT_POLL_INTERVAL)
+        return self.fetch()
+
+    def _readdata(self) -> tuple:
         """Internal function for triggering the AHT to read temp/humidity"""
-        self._buf[0] = AHTX0_CMD_TRIGGER
-        self._buf[1] = 0x33
-        self._buf[2] = 0x00
+        if (
+            self._measurement is not None
+            and time.monotonic() - self._last_read < self._cache_s
+        ):
+            return self._measurement
+        # Hold the bus for the whole trigger/poll/read sequence
         with self.i2c_device as i2c:
-            i2c.write(self._buf, start=0, end=3)
-        while self.status & AHTX0_STATUS_BUSY:
-            time.sleep(0.01)
+            self._read_locked(i2c)
+        return self._convert()
+
+    def read_many(self, n: int, out_t: array.array, out_h: array.array) -> None:
+        """Take ``n`` measurements back-to-back, holding the I2C bus for the whole
+        run. Temperatures are stored in ``out_t`` and relative humidities in
+        ``out_h``, which must each hold at least ``n`` values, for example
+        ``array.array("f", [0.0] * n)``. The last sample also becomes the cached
+        reading returned by :attr:`measurements`."""
+        if len(out_t) < n or len(out_h) < n:
+            raise ValueError("Output buffers must hold at least n values")
+        buf = self._buf
+        measurement = None
         with self.i2c_device as i2c:
-            i2c.readinto(self._buf, start=0, end=6)
-
-        self._humidity = (
-            (self._buf[1] << 12) | (self._buf[2] << 4) | (self._buf[3] >> 4)
-        )
-        self._humidity = (self._humidity * 100) / 0x100000
-        self._temp = ((self._buf[3] & 0xF) << 16) | (self._buf[4] << 8) | self._buf[5]
-        self._temp = ((self._temp * 200.0) / 0x100000) - 50
+            for i in range(n):
+                self._read_locked(i2c)
+                humidity, temp = _unpack(buf)
+                measurement = _scale(temp, humidity)
+                out_t[i], out_h[i] = measurement
+        if measurement is not None:
+            self._measurement = measurement
+            self._last_read = time.monotonic()
+
+    def _read_locked(self, i2c: I2CDevice) -> None:
+        """Internal function for triggering a reading and reading it into the buffer,
+        on an already locked device"""
+        i2c.write(_CMD_TRIGGER)
+        # Wait out the typical conversion time before polling the busy bit
+        time.sleep(_AHT_MEAS_TIME)
+        i2c.readinto(self._stat)
+        while self._stat[0] & AHTX0_STATUS_BUSY:
+            time.sleep(_AHT_POLL_INTERVAL)
+            i2c.readinto(self._stat)
+        i2c.readinto(self._buf)
+
+    def _convert(self) -> tuple:
+        """Internal function for scaling the raw reading in the buffer"""
+        humidity, temp = _unpack(self._buf)
+        self._measurement = _scale(temp, humidity)
+        self._last_read = time.monotonic()
+        return self._measurement
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Read the `AHTx0` from an asyncio task, so other tasks keep running
+while the sensor converts
+"""
+
+import asyncio
+import board
+import adafruit_ahtx0
+
+# Create sensor object, communicating over the board's default I2C bus
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+sensor = adafruit_ahtx0.AHTx0(i2c)
+
+
+async def read_sensor():
+    while True:
+        temperature, relative_humidity = await sensor.measure()
+        print("\nTemperature: %0.1f C" % temperature)
+        print("Humidity: %0.1f %%" % relative_humidity)
+        await asyncio.sleep(2)
+
+
+async def heartbeat():
+    while True:
+        print(".")
+        await asyncio.sleep(0.5)
+
+
+async def main():
+    await asyncio.gather(
+        asyncio.create_task(read_sensor()), asyncio.create_task(heartbeat())
+    )
+
+
+asyncio.run(main())